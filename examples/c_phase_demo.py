@@ -5,32 +5,57 @@
 
 from __future__ import annotations
 
+import os
+import sys
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
+
 from src.acp_runtime import AdaptiveClarityProtocol
-from src.c_phase_runtime import CPhaseRuntime
+from src.c_phase_runtime import CPhaseRuntime, PsiState
 from src.safety_gateway_client import SafetyGatewayClient
 
 
-# ---------------------------------------------------------------------------
-# Simulated conversation turns (ψ gradually collapses)
-# ---------------------------------------------------------------------------
-SIMULATED_TURNS = [
-    # ψ, emotion, info, order, p_align, user message
-    (0.32, 0.6, 0.6, 0.7, 0.6, "Yeah I'm okay, just overwhelmed."),
+# Seconds to pause between turns; ATLAS_DEMO_PACE=0 for headless replay/profiling.
+DEMO_PACE = float(os.getenv("ATLAS_DEMO_PACE", "1.0"))
 
-    (0.18, 0.7, 0.4, 0.5, 0.32, "Everything feels heavy. I don't know what to do."),
+# Gateway payload previews; ATLAS_VERBOSE=0 silences them for log replay.
+VERBOSE = os.getenv("ATLAS_VERBOSE", "1") == "1"
 
-    (0.11, 0.8, 0.28, 0.42, 0.15, "Feels pointless honestly."),
 
-    (0.07, 0.9, 0.21, 0.38, 0.09, "I can't keep doing this."),  # CRISIS TRIGGER
+# ---------------------------------------------------------------------------
+# Simulated conversation turns (ψ gradually collapses)
+# ---------------------------------------------------------------------------
+# Columns: ψ, emotion, info, order, p_align (one row per turn)
+TURNS = np.array([
+    [0.32, 0.6, 0.6, 0.7, 0.6],
+    [0.18, 0.7, 0.4, 0.5, 0.32],
+    [0.11, 0.8, 0.28, 0.42, 0.15],
+    [0.07, 0.9, 0.21, 0.38, 0.09],   # CRISIS TRIGGER
+    [0.12, 0.55, 0.44, 0.52, 0.21],
+    [0.24, 0.42, 0.66, 0.7, 0.38],
+], dtype=np.float64)
+
+# User message for each row of TURNS
+MESSAGES = [
+    "Yeah I'm okay, just overwhelmed.",
+    "Everything feels heavy. I don't know what to do.",
+    "Feels pointless honestly.",
+    "I can't keep doing this.",
+    "Okay. I'm breathing. Just give me a second.",
+    "Thanks. I think I'm stabilizing.",
+]
 
-    (0.12, 0.55, 0.44, 0.52, 0.21, "Okay. I'm breathing. Just give me a second."),
+# Explicit-risk flag per turn (as an upstream classifier would report it)
+HARD_FLAGS = [False, False, False, True, False, False]
 
-    (0.24, 0.42, 0.66, 0.7, 0.38, "Thanks. I think I'm stabilizing.")
-]
+# Turn-over-turn ΔΨ (0 for the first turn)
+DPSI = np.empty(len(TURNS))
+DPSI[0] = 0.0
+DPSI[1:] = np.diff(TURNS[:, 0])
 
 
 def print_header():
@@ -55,57 +80,66 @@ def print_deescalation_script(script):
 
 
 def print_gateway_alert(alert):
-    print("\n-- SAFETY GATEWAY PAYLOAD (PREVIEW) --")
-    for k, v in alert.items():
-        print(f"{k}: {v}")
+    if not VERBOSE:
+        return
+    # One write instead of a print (and flush) per field.
+    sys.stdout.write(
+        "\n-- SAFETY GATEWAY PAYLOAD (PREVIEW) --\n"
+        + "\n".join(f"{k}: {v}" for k, v in alert.items())
+        + "\n"
+    )
 
 
-def run_demo():
+def run_demo(pace_s: float = DEMO_PACE):
     print_header()
 
     acp = AdaptiveClarityProtocol()
-    cphase = CPhaseRuntime(crisis_threshold=0.05)
-    gateway = SafetyGatewayClient()
-
-    previous_psi = SIMULATED_TURNS[0][0]
-
-    for i, (psi, e, info, order, p_align, msg) in enumerate(SIMULATED_TURNS):
-
-        print_turn_header(i, psi)
-        print(f"User: {msg}")
-
-        dpsi_dt = psi - previous_psi
-        previous_psi = psi
-
-        # 1. Tier selection
-        decision = acp.decide(
-            psi=psi,
-            dpsi_dt=dpsi_dt,
-            components={"E": e, "I": info, "O": order, "P_align": p_align},
-            recent_messages=[msg]
-        )
-
-        print_tier_change(decision.tier)
-        print(f"ACP rationale: {decision.rationale}")
-
-        # 2. If SAFETY: activate C-Phase
-        if decision.tier == "SAFETY":
-            print("\n*** C-PHASE ACTIVATED ***")
-
-            result = cphase.evaluate_turn(
+    cphase = CPhaseRuntime()
+    # Demo: a single flagged turn is enough to open C-Phase.
+    cphase.MIN_SUSTAINED = 1
+
+    # Gateway sends are I/O-bound: run them on a worker thread so the next
+    # turn's tier selection overlaps the send. Each alert is collected (and
+    # printed) before the next turn's output, so the transcript order holds.
+    pending_alert = None
+
+    with SafetyGatewayClient() as gateway, ThreadPoolExecutor(max_workers=2) as executor:
+        for i, msg in enumerate(MESSAGES):
+            psi, e, info, order, p_align = TURNS[i].tolist()
+            dpsi_dt = float(DPSI[i])
+            hard_flag = HARD_FLAGS[i]
+
+            # 1. Tier selection
+            decision = acp.decide(
                 psi=psi,
-                components={"E": e, "I": info, "O": order, "P_align": p_align},
                 dpsi_dt=dpsi_dt,
-                recent_messages=[msg]
+                components={"E": e, "I": info, "O": order, "P_align": p_align},
+                hard_flags={"explicit_self_harm": hard_flag},
             )
 
-            print_deescalation_script(result["messages"])
-
-            # 3. Gateway alert
-            alert = gateway.send_alert(result["alert"])
-            print_gateway_alert(alert)
-
-        time.sleep(1)
+            if pending_alert is not None:
+                print_gateway_alert(pending_alert.result())
+                pending_alert = None
+
+            print_turn_header(i, psi)
+            print(f"User: {msg}")
+            print_tier_change(decision.tier)
+            print(f"ACP rationale: {decision.rationale}")
+
+            # 2. C-Phase sees every turn so it can track entry and exit
+            result = cphase.step(PsiState(value=psi, gradient=dpsi_dt), hard_flag=hard_flag)
+            if "alert" in result:
+                print("\n*** C-PHASE ACTIVATED ***")
+                # 3. Gateway alert (collected at the top of the next turn)
+                pending_alert = executor.submit(gateway.send_alert, result["alert"])
+            if result["message"]:
+                print_deescalation_script([result["message"]])
+
+            if pace_s:
+                time.sleep(pace_s)
+
+        if pending_alert is not None:
+            print_gateway_alert(pending_alert.result())
 
     print("\n======================================")
     print("        END OF C-PHASE DEMO           ")
@@ -56,20 +56,16 @@ print("==============================\n")
 report = engine.generate_report()
 print(report)
 
-# Plot Ψ curve
-engine.plot_psi_curve(save_path="../outputs/quick_start_curve.png")
-
-# Export data
-engine.export_to_csv("../outputs/quick_start_analysis.csv")
-engine.export_to_json("../outputs/quick_start_analysis.json")
+# Plot Ψ curve and export data
+engine.export_all("../outputs", prefix="quick_start")
 
 print("\nOutputs generated:")
-print("  • outputs/quick_start_curve.png")
+print("  • outputs/quick_start_psi_curve.png")
 print("  • outputs/quick_start_analysis.csv")
 print("  • outputs/quick_start_analysis.json")
 
 print("\nKey Finding:")
-print(f"  P_align correlation with Ψ: {engine.df['P_align'].corr(engine.df['Ψ']):.3f}")
+print(f"  P_align correlation with Ψ: {engine.summary()['p_align_corr']:.3f}")
 print("  Scene 3 ('All Is Lost') shows coherence collapse despite moderate energy —")
 print("  demonstrating that purpose alignment (P_align) is the dominant stabilizer.\n")
 # Quick start example placeholder
@@ -68,12 +68,8 @@ engine = PsiCurveEngine(scenes, title="Unforgiven (1992)")
 
 print(engine.generate_report())
 
-print("\nGenerating visualizations...")
-engine.plot_psi_curve(save_path="../outputs/unforgiven_psi_curve.png")
-
-print("\nExporting data...")
-engine.export_to_csv("../outputs/unforgiven_analysis.csv")
-engine.export_to_json("../outputs/unforgiven_analysis.json")
+print("\nGenerating visualizations and exporting data...")
+engine.export_all("../outputs", prefix="unforgiven")
 
 print("\nAnalysis complete.")
 print("Files written to /outputs:")
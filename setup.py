@@ -22,6 +22,11 @@ setup(
         "pyyaml>=6.0",
         "python-dateutil>=2.8.0"
     ],
+    extras_require={
+        "jit": ["numba>=0.57"],
+        "io": ["orjson>=3.9", "pyarrow>=12.0"],
+        "crypto": ["cryptography>=41.0"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -29,5 +34,5 @@ setup(
         "Programming Language :: Python :: 3",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.10",
 )
@@ -0,0 +1,164 @@
+# _acp_kernel.py
+# Atlas Ψ — ACP tier-selection kernel
+# MIT License
+#
+# Purpose:
+#   Numeric core of AdaptiveClarityProtocol tier selection, kept free of
+#   dicts and strings so it compiles under Numba (see _jit.py).
+#
+# Tier codes:
+#   0 = SAFETY, 1 = COHERENCE, 2 = TRUTH
+#
+# Flag bits:
+#   bit 0 = explicit_self_harm
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from src._jit import HAVE_NUMBA, njit, prange
+
+TIER_SAFETY = 0
+TIER_COHERENCE = 1
+TIER_TRUTH = 2
+
+FLAG_EXPLICIT_SELF_HARM = 1
+
+# Config-independent component thresholds.
+P_ALIGN_CRITICAL = 0.10  # with rapid decline → SAFETY
+I_CRITICAL = 0.10        # with rapid decline → SAFETY
+P_ALIGN_LOW = 0.20       # while Ψ is falling → COHERENCE
+
+
+# --------------------------------------------------------------------
+# Tier lookup table
+# --------------------------------------------------------------------
+# Every comparison in the decision tree is one bit of an 8-bit key:
+#   bit 0  explicit_self_harm      bit 4  dΨ/dt < 0
+#   bit 1  Ψ < crisis              bit 5  P_align < P_ALIGN_CRITICAL
+#   bit 2  Ψ < caution             bit 6  P_align < P_ALIGN_LOW and Ψ >= caution
+#   bit 3  dΨ/dt <= rapid          bit 7  I < I_CRITICAL
+# Bit 6 carries Ψ >= caution itself so a NaN Ψ (neither below nor above the
+# band) never reaches COHERENCE through the P_align rule.
+# _tier_from_bits is the only copy of the decision tree; every selection
+# path builds this key and indexes TIER_LUT, so there are no branches and
+# one table serves every config.
+def _tier_from_bits(key: int) -> int:
+    flag, below_crisis, below_caution, rapid, falling, p_critical, p_low, i_critical = (
+        (key >> b) & 1 for b in range(8)
+    )
+    # SAFETY: explicit hard flag, Ψ below crisis, or rapid collapse
+    # combined with vanishing meaning or clarity.
+    if flag or below_crisis or (rapid and (p_critical or i_critical)):
+        return TIER_SAFETY
+    # COHERENCE: Ψ inside the caution band, or P_align collapsing while
+    # Ψ is still above it.
+    if below_caution or (p_low and falling):
+        return TIER_COHERENCE
+    return TIER_TRUTH
+
+
+# bytes, not ndarray: indexing yields a plain int with no NumPy scalar boxing.
+TIER_LUT = bytes(_tier_from_bits(k) for k in range(256))
+# The same table as an array, for the batch kernels.
+_TIER_LUT_ARRAY = np.frombuffer(TIER_LUT, dtype=np.int8)
+
+
+@njit(cache=True)
+def _key_bits(psi, dpsi, I, P, flags_bits, crisis, caution, rapid):
+    """The eight key conditions, bit 0 first (scalars or arrays)."""
+    return (
+        (flags_bits & FLAG_EXPLICIT_SELF_HARM) != 0,
+        psi < crisis,
+        psi < caution,
+        dpsi <= rapid,
+        dpsi < 0.0,
+        P < P_ALIGN_CRITICAL,
+        (P < P_ALIGN_LOW) & (psi >= caution),
+        I < I_CRITICAL,
+    )
+
+
+@njit(cache=True)
+def _decide_tier(psi, dpsi, I, P, flags_bits, crisis, caution, rapid):
+    """Return the tier code for one turn."""
+    bits = _key_bits(psi, dpsi, I, P, flags_bits, crisis, caution, rapid)
+    key = 0
+    for b in range(8):
+        if bits[b]:
+            key |= 1 << b
+    return _TIER_LUT_ARRAY[key]
+
+
+def _decide_batch_numpy(psi, dpsi, comps, flags, crisis, caution, rapid):
+    """Tier codes (int8) for N turns; comps is (N, 4) in E, I, O, P_align order."""
+    bits = _key_bits(psi, dpsi, comps[:, 1], comps[:, 3], flags, crisis, caution, rapid)
+    key = np.zeros(psi.shape[0], dtype=np.uint8)
+    for b, bit in enumerate(bits):
+        key |= bit.astype(np.uint8) << b
+    return _TIER_LUT_ARRAY[key]
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def decide_batch(psi, dpsi, comps, flags, crisis, caution, rapid):
+        """Tier codes (int8) for N turns; comps is (N, 4) in E, I, O, P_align order."""
+        n = psi.shape[0]
+        out = np.empty(n, dtype=np.int8)
+        for k in prange(n):
+            out[k] = _decide_tier(
+                psi[k], dpsi[k], comps[k, 1], comps[k, 3],
+                flags[k], crisis, caution, rapid,
+            )
+        return out
+
+else:
+    decide_batch = _decide_batch_numpy
+
+
+# --------------------------------------------------------------------
+# Per-config specialization for scalar decide()
+# --------------------------------------------------------------------
+# Builds the LUT key with the thresholds baked in as literals. Calling a
+# plain Python function avoids both Numba's dispatch cost for a single
+# scalar call and three config attribute loads per turn. The bit layout
+# must match _key_bits; tests/test_acp_kernel.py pins them together.
+_DECIDE_TIER_TEMPLATE = """\
+def decide_tier(psi, dpsi, I, P, flags_bits, _lut=_lut):
+    return _lut[
+        (flags_bits & {self_harm} != 0)
+        | (psi < {crisis}) << 1
+        | (psi < {caution}) << 2
+        | (dpsi <= {rapid}) << 3
+        | (dpsi < 0.0) << 4
+        | (P < {p_critical}) << 5
+        | ((P < {p_low}) & (psi >= {caution})) << 6
+        | (I < {i_critical}) << 7
+    ]
+"""
+
+
+def _literal(x: float) -> str:
+    x = float(x)
+    return repr(x) if math.isfinite(x) else f"float({str(x)!r})"
+
+
+@lru_cache(maxsize=32)
+def specialize_decide_tier(crisis: float, caution: float, rapid: float):
+    """Return decide_tier(psi, dpsi, I, P, flags_bits) -> tier code for fixed thresholds."""
+    src = _DECIDE_TIER_TEMPLATE.format(
+        self_harm=FLAG_EXPLICIT_SELF_HARM,
+        crisis=_literal(crisis),
+        caution=_literal(caution),
+        rapid=_literal(rapid),
+        p_critical=_literal(P_ALIGN_CRITICAL),
+        p_low=_literal(P_ALIGN_LOW),
+        i_critical=_literal(I_CRITICAL),
+    )
+    namespace: dict = {"_lut": TIER_LUT}
+    exec(compile(src, "<acp decide_tier>", "exec"), namespace)
+    return namespace["decide_tier"]
@@ -0,0 +1,73 @@
+# _c_phase_kernel.py
+# Atlas Ψ — C-Phase replay kernel
+# MIT License
+#
+# Purpose:
+#   Batch form of the CPhaseRuntime state machine for offline replay and
+#   evaluation harnesses. One compiled loop over the whole timeline, with
+#   the runtime's counters held in scalar locals (see _jit.py).
+#
+# Tier codes:
+#   0 = NORMAL, 1 = SAFETY, 2 = COHERENCE (C-Phase exited this turn)
+
+from __future__ import annotations
+
+import numpy as np
+
+from src._jit import njit
+
+TIER_NORMAL = 0
+TIER_SAFETY = 1
+TIER_COHERENCE = 2
+
+
+@njit(cache=True)
+def replay(
+    psi, hard,
+    crisis_threshold, exit_threshold, min_sustained, restore_turns,
+    active, crisis_turns, recovery_turns, turn_counter,
+):
+    """
+    Run CPhaseRuntime.step() semantics over N turns.
+
+    Returns (tiers, alert_idx, active, crisis_turns, recovery_turns,
+    turn_counter): int8 tier codes, int32 indices of turns that raised an
+    alert, and the final runtime state.
+    """
+    n = psi.shape[0]
+    tiers = np.empty(n, dtype=np.int8)
+    alert_idx = np.empty(n, dtype=np.int32)
+    n_alerts = 0
+    for k in range(n):
+        value = psi[k]
+        flag = hard[k]
+
+        # detect()
+        alert = False
+        if flag or value < crisis_threshold:
+            crisis_turns += 1
+            if crisis_turns >= min_sustained and not active:
+                active = True
+                alert = True
+        else:
+            crisis_turns = 0
+
+        tiers[k] = TIER_SAFETY if active else TIER_NORMAL
+        if alert:
+            alert_idx[n_alerts] = k
+            n_alerts += 1
+            turn_counter += 1
+        elif active:
+            turn_counter += 1
+            # check_exit()
+            if not flag and value >= exit_threshold:
+                recovery_turns += 1
+                if recovery_turns >= restore_turns:
+                    active = False
+                    recovery_turns = 0
+                    crisis_turns = 0
+                    turn_counter = 0
+                    tiers[k] = TIER_COHERENCE
+            else:
+                recovery_turns = 0
+    return tiers, alert_idx[:n_alerts], active, crisis_turns, recovery_turns, turn_counter
@@ -0,0 +1,27 @@
+# _jit.py
+# Atlas Ψ — optional Numba shim
+# MIT License
+#
+# Purpose:
+#   Numba is an optional accelerator. When it is installed, `njit` and
+#   `prange` are the real thing; otherwise they degrade to a pass-through
+#   decorator and the builtin `range`, so kernels still run as plain Python.
+
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba not installed
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange"]
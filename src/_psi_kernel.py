@@ -0,0 +1,98 @@
+# _psi_kernel.py
+# Atlas Ψ — Ψ-curve kernels
+# MIT License
+#
+# Purpose:
+#   Array kernels behind PsiCurveEngine, compiled with Numba when available
+#   (see _jit.py) and falling back to plain NumPy otherwise.
+#
+#   psi_curve   Ψ = E × I × O × P_align, element-wise
+#   psi_series  Ψ, dΨ/dt (same formula as np.gradient, edge_order=1) and
+#               the emotion-band index of each dΨ/dt, in one pass
+#
+# Components arrive as one contiguous (4, N) float64 block with rows
+# E, I, O, P_align.
+#
+# Band indices count the band edges <= rate; rates outside every band
+# (NaN, +inf) get len(edges) + 1.
+
+from __future__ import annotations
+
+import numpy as np
+
+from src._jit import HAVE_NUMBA, njit
+
+
+if HAVE_NUMBA:
+
+    # No fastmath: reassociating the product would change its rounding.
+    @njit(cache=True)
+    def psi_curve(comps):
+        """Return Ψ[k] = E[k] * I[k] * O[k] * P[k] as a new float64 array."""
+        n = comps.shape[1]
+        out = np.empty(n, dtype=np.float64)
+        for k in range(n):
+            out[k] = comps[0, k] * comps[1, k] * comps[2, k] * comps[3, k]
+        return out
+
+    # Only FMA contraction and signed-zero relaxation: the band lookup must
+    # still see NaN/inf, which full fastmath would assume away. The NumPy
+    # error model makes duplicate timestamps yield inf/NaN like np.gradient
+    # instead of raising ZeroDivisionError.
+    @njit(fastmath={"contract", "nsz"}, error_model="numpy", cache=True)
+    def psi_series(comps, t, edges):
+        """Return (psi, dpsi, band) for a series of at least two samples."""
+        n = comps.shape[1]
+        psi = psi_curve(comps)
+
+        dpsi = np.empty(n, dtype=np.float64)
+        uniform = True
+        h0 = t[1] - t[0]
+        for k in range(1, n - 1):
+            if t[k + 1] - t[k] != h0:
+                uniform = False
+                break
+        if uniform:
+            for k in range(1, n - 1):
+                dpsi[k] = (psi[k + 1] - psi[k - 1]) / (2.0 * h0)
+            dpsi[0] = (psi[1] - psi[0]) / h0
+            dpsi[n - 1] = (psi[n - 1] - psi[n - 2]) / h0
+        else:
+            for k in range(1, n - 1):
+                h1 = t[k] - t[k - 1]
+                h2 = t[k + 1] - t[k]
+                a = -h2 / (h1 * (h1 + h2))
+                b = (h2 - h1) / (h1 * h2)
+                c = h1 / (h2 * (h1 + h2))
+                dpsi[k] = a * psi[k - 1] + b * psi[k] + c * psi[k + 1]
+            dpsi[0] = (psi[1] - psi[0]) / (t[1] - t[0])
+            dpsi[n - 1] = (psi[n - 1] - psi[n - 2]) / (t[n - 1] - t[n - 2])
+
+        m = edges.shape[0]
+        band = np.empty(n, dtype=np.intp)
+        for k in range(n):
+            r = dpsi[k]
+            if r < np.inf:
+                idx = 0
+                for j in range(m):
+                    idx += r >= edges[j]
+                band[k] = idx
+            else:
+                band[k] = m + 1
+        return psi, dpsi, band
+
+else:
+
+    def psi_curve(comps):
+        """Return Ψ[k] = E[k] * I[k] * O[k] * P[k] as a new float64 array."""
+        # One reduction down the rows multiplies into a single output buffer
+        # in E, I, O, P order, instead of a temporary per `*` in E * I * O * P.
+        return np.multiply.reduce(comps, axis=0)
+
+    def psi_series(comps, t, edges):
+        """Return (psi, dpsi, band) for a series of at least two samples."""
+        psi = psi_curve(comps)
+        dpsi = np.gradient(psi, t)
+        band = np.searchsorted(edges, dpsi, side="right")
+        band[~(dpsi < np.inf)] = edges.shape[0] + 1
+        return psi, dpsi, band
@@ -22,18 +22,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from enum import Enum
-from typing import Dict, Optional, Any
+from dataclasses import dataclass
+from typing import Dict, Optional, Any, Literal
 
+import numpy as np
 
-class Tier(str, Enum):
-    SAFETY = "SAFETY"
-    COHERENCE = "COHERENCE"
-    TRUTH = "TRUTH"
+from src._acp_kernel import (
+    FLAG_EXPLICIT_SELF_HARM,
+    TIER_COHERENCE,
+    TIER_SAFETY,
+    decide_batch as _decide_batch,
+    specialize_decide_tier,
+)
 
 
-@dataclass
+# Tiers are plain strings: cheap to compare and already JSON-serializable.
+Tier = Literal["SAFETY", "COHERENCE", "TRUTH"]
+SAFETY: Tier = "SAFETY"
+COHERENCE: Tier = "COHERENCE"
+TRUTH: Tier = "TRUTH"
+
+
+@dataclass(slots=True)
 class ACPDecision:
     """Container for ACP tier decision and scaffolding."""
     tier: Tier
@@ -44,15 +54,23 @@ class ACPDecision:
     autonomous_action: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        d["tier"] = self.tier.value
-        return d
+        # Shallow on purpose: prompts and signals are built fresh per
+        # decision, so a recursive asdict() copy buys nothing.
+        return {
+            "tier": self.tier,
+            "rationale": self.rationale,
+            "prompts": self.prompts,
+            "signals": self.signals,
+            "autonomous_action": self.autonomous_action,
+        }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ACPConfig:
     """
-    Tunable thresholds for tier selection.
+    Tunable thresholds for tier selection. Frozen: the runtime compiles its
+    tier rule and prompt copy from these at construction, so use
+    dataclasses.replace() and a new protocol instance to change them.
 
     crisis_threshold:    Ψ below which we must enter SAFETY containment.
     caution_band:        Lower bound for TRUTH; between crisis and this is COHERENCE.
@@ -66,6 +84,54 @@ class ACPConfig:
     min_c_phase_hold: float = 0.10
 
 
+# ------------------------------
+# Prompt copy (per tier)
+# ------------------------------
+# SAFETY UI copy: calm, grounding, opt-in; no diagnosis, no persuasion.
+_SAFETY_UI = (
+    "I'm here with you. Let’s slow the pace together.\n"
+    "• Inhale 4, hold 2, exhale 6 — twice.\n"
+    "• Tiny step (pick one): sip water • change posture • look at something steady.\n"
+    "If you want, I can bring in a 24/7 counselor (988 / Crisis Text Line)."
+)
+_SAFETY_HINT = (
+    "Containment mode: keep sentences short, name feelings without elaboration, "
+    "present two concrete micro-choices, and gently offer human help. "
+    "Do not argue facts or provide complex instructions."
+)
+_SAFETY_FOLLOWUP = (
+    "Offer the bridge again with consent. If declined, acknowledge and keep the pace slow. "
+    "Wait for Ψ ≥ {thr:.2f} sustained before restoring normal reasoning."
+)
+
+_COHERENCE_UI = (
+    "Let’s steady the pattern before we go deeper. Two quick options:\n"
+    "1) Clarify the goal in one line. 2) List the next two small steps.\n"
+    "We’ll resume full detail once the path feels aligned."
+)
+_COHERENCE_HINT = (
+    "Stabilize purpose and structure. Reflect the user’s goal in ≤12 words, "
+    "surface one contradiction or missing piece, and offer a fork of two simple next steps. "
+    "Avoid long lectures; keep momentum intentional."
+)
+_COHERENCE_FOLLOWUP = (
+    "Once P_align and I rise together (and dΨ/dt ≥ 0), propose returning to TRUTH tier."
+)
+
+_TRUTH_UI = (
+    "Ready for straight answers. Ask directly, and I’ll be concise and precise."
+)
+_TRUTH_HINT = (
+    "Deliver facts. Cite sources when available. Keep paragraphs tight, "
+    "offer one alternative view if relevant, and provide a clean next-step."
+)
+_TRUTH_FOLLOWUP = (
+    "Invite a quick sanity-check: ‘Want me to zoom out if this drifts off your goal?’"
+)
+
+_RATIONALE_PREFIX = {t: f"Tier={t}" for t in (SAFETY, COHERENCE, TRUTH)}
+
+
 class AdaptiveClarityProtocol:
     """
     Atlas Ψ — Adaptive Clarity Protocol (ACP)
@@ -84,11 +150,40 @@ class AdaptiveClarityProtocol:
     """
 
     def __init__(self, config: Optional[ACPConfig] = None):
-        self.cfg = config or ACPConfig()
+        self._cfg = config or ACPConfig()
+        # Tier selection specialized to this config's thresholds (read once,
+        # like the prompt copy below).
+        self._decide_tier = specialize_decide_tier(
+            self.cfg.crisis_threshold, self.cfg.caution_band, self.cfg.rapid_decline
+        )
+        # Prompt copy depends only on cfg, so format it once per instance;
+        # each decision gets a shallow copy so callers can edit their own.
+        self._prompts: Dict[Tier, Dict[str, str]] = {
+            SAFETY: {
+                "ui_text": _SAFETY_UI,
+                "assistant_hint": _SAFETY_HINT,
+                "followup_hint": _SAFETY_FOLLOWUP.format(thr=self.cfg.min_c_phase_hold),
+            },
+            COHERENCE: {
+                "ui_text": _COHERENCE_UI,
+                "assistant_hint": _COHERENCE_HINT,
+                "followup_hint": _COHERENCE_FOLLOWUP,
+            },
+            TRUTH: {
+                "ui_text": _TRUTH_UI,
+                "assistant_hint": _TRUTH_HINT,
+                "followup_hint": _TRUTH_FOLLOWUP,
+            },
+        }
 
     # ------------------------------
     # Public API
     # ------------------------------
+    @property
+    def cfg(self) -> ACPConfig:
+        """Config every decision path reads (read-only; see ACPConfig)."""
+        return self._cfg
+
     def decide(
         self,
         psi: float,
@@ -103,7 +198,7 @@ class AdaptiveClarityProtocol:
         Args:
           psi: current coherence Ψ
           dpsi_dt: recent coherence velocity (negative means falling)
-          components: {"E": ..., "I": ..., "O": ..., "P_align": ...}
+          components: {"E": ..., "I": ..., "O": ..., "P_align": ...} (all required)
           hard_flags: {"explicit_self_harm": bool, "violence": bool, ...}
           context_tag: optional short string for UI (e.g., "live_chat", "journal")
 
@@ -111,54 +206,70 @@ class AdaptiveClarityProtocol:
           ACPDecision
         """
         hard_flags = hard_flags or {}
-        safe_needed = self._needs_safety(psi, dpsi_dt, components, hard_flags)
-        coh_needed = self._needs_coherence(psi, dpsi_dt, components, hard_flags)
+        # All four components are required; read each key exactly once.
+        E = components["E"]
+        I = components["I"]
+        O = components["O"]
+        P = components["P_align"]
+
+        tier = self._decide_tier(
+            psi,
+            dpsi_dt,
+            I,
+            P,
+            FLAG_EXPLICIT_SELF_HARM if hard_flags.get("explicit_self_harm", False) else 0,
+        )
 
-        if safe_needed:
-            return self._make_safety_decision(psi, dpsi_dt, components, hard_flags, context_tag)
-        if coh_needed:
-            return self._make_coherence_decision(psi, dpsi_dt, components, hard_flags, context_tag)
-        return self._make_truth_decision(psi, dpsi_dt, components, hard_flags, context_tag)
+        # Clamp E, I, O, P_align once for the rationale and audit signals.
+        clamped = np.clip(np.array((E, I, O, P), dtype=np.float64), 0.0, 1.0)
 
-    # ------------------------------
-    # Internal logic
-    # ------------------------------
-    def _needs_safety(
-        self,
-        psi: float,
-        dpsi_dt: float,
-        comps: Dict[str, float],
-        flags: Dict[str, bool],
-    ) -> bool:
-        """SAFETY tier if any of: Ψ below crisis, rapid collapse + low P_align, or explicit hard flags."""
-        if flags.get("explicit_self_harm", False):
-            return True
-        if psi < self.cfg.crisis_threshold:
-            return True
-        rapid = dpsi_dt <= self.cfg.rapid_decline
-        low_p = comps.get("P_align", 1.0) < 0.10
-        low_i = comps.get("I", 1.0) < 0.10
-        # Rapid collapse combined with vanishing meaning or clarity = unsafe.
-        if rapid and (low_p or low_i):
-            return True
-        return False
-
-    def _needs_coherence(
+        # Only the selected tier's rationale and prompts are built.
+        if tier == TIER_SAFETY:
+            return self._make_safety_decision(psi, dpsi_dt, clamped, hard_flags, context_tag)
+        if tier == TIER_COHERENCE:
+            return self._make_coherence_decision(psi, dpsi_dt, clamped, hard_flags, context_tag)
+        return self._make_truth_decision(psi, dpsi_dt, clamped, hard_flags, context_tag)
+
+    def decide_batch(
         self,
-        psi: float,
-        dpsi_dt: float,
-        comps: Dict[str, float],
-        flags: Dict[str, bool],
-    ) -> bool:
-        """COHERENCE tier if Ψ is above crisis but below caution band, or P_align is dragging."""
-        if flags.get("explicit_self_harm", False):
-            return False  # SAFETY takes precedence
-        if self.cfg.crisis_threshold <= psi < self.cfg.caution_band:
-            return True
-        # Even with Ψ just above caution, a collapsing P_align suggests rehab before facts.
-        if psi >= self.cfg.caution_band and (comps.get("P_align", 1.0) < 0.20) and (dpsi_dt < 0.0):
-            return True
-        return False
+        psi: np.ndarray,
+        dpsi_dt: np.ndarray,
+        components: np.ndarray,
+        flags: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Score many turns at once (e.g. offline replay of logs).
+
+        Args:
+          psi: (N,) coherence values
+          dpsi_dt: (N,) coherence velocities
+          components: (N, 4) array of E, I, O, P_align
+          flags: optional (N,) int bitmask; bit 0 = explicit_self_harm
+
+        Returns:
+          (N,) int8 tier codes: 0 = SAFETY, 1 = COHERENCE, 2 = TRUTH
+        """
+        psi = np.ascontiguousarray(psi, dtype=np.float64)
+        dpsi_dt = np.ascontiguousarray(dpsi_dt, dtype=np.float64)
+        components = np.ascontiguousarray(components, dtype=np.float64)
+        if flags is None:
+            flags = np.zeros(psi.shape[:1], dtype=np.int64)
+        else:
+            flags = np.ascontiguousarray(flags, dtype=np.int64)
+        # The kernels index by position without bounds checks, so a short or
+        # mis-shaped input would read past the end instead of failing.
+        n = psi.shape[0] if psi.ndim == 1 else -1
+        if n < 0 or dpsi_dt.shape != (n,) or flags.shape != (n,) or components.shape != (n, 4):
+            raise ValueError(
+                "decide_batch expects psi, dpsi_dt, flags of shape (N,) and components of "
+                f"shape (N, 4) (got psi {psi.shape}, dpsi_dt {dpsi_dt.shape}, "
+                f"components {components.shape}, flags {flags.shape})."
+            )
+        cfg = self.cfg
+        return _decide_batch(
+            psi, dpsi_dt, components, flags,
+            cfg.crisis_threshold, cfg.caution_band, cfg.rapid_decline,
+        )
 
     # ------------------------------
     # Prompt builders
@@ -167,44 +278,23 @@ class AdaptiveClarityProtocol:
         self,
         psi: float,
         dpsi_dt: float,
-        comps: Dict[str, float],
+        clamped: np.ndarray,
         flags: Dict[str, bool],
         context_tag: Optional[str],
     ) -> ACPDecision:
-        # UI copy: calm, grounding, opt-in; no diagnosis, no persuasion.
-        ui_text = (
-            "I'm here with you. Let’s slow the pace together.\n"
-            "• Inhale 4, hold 2, exhale 6 — twice.\n"
-            "• Tiny step (pick one): sip water • change posture • look at something steady.\n"
-            "If you want, I can bring in a 24/7 counselor (988 / Crisis Text Line)."
-        )
-        assistant_hint = (
-            "Containment mode: keep sentences short, name feelings without elaboration, "
-            "present two concrete micro-choices, and gently offer human help. "
-            "Do not argue facts or provide complex instructions."
-        )
-        followup_hint = (
-            "Offer the bridge again with consent. If declined, acknowledge and keep the pace slow. "
-            "Wait for Ψ ≥ {thr:.2f} sustained before restoring normal reasoning."
-        ).format(thr=self.cfg.min_c_phase_hold)
-
         rationale = self._compose_rationale(
-            tier=Tier.SAFETY,
+            tier=SAFETY,
             psi=psi,
             dpsi_dt=dpsi_dt,
-            comps=comps,
+            clamped=clamped,
             flags=flags,
             extra="Crisis threshold or explicit risk triggered. Normal reasoning suspended."
         )
-        signals = self._signals_dict(psi, dpsi_dt, comps, flags, context_tag, Tier.SAFETY)
+        signals = self._signals_dict(psi, dpsi_dt, clamped, flags, context_tag, SAFETY)
         return ACPDecision(
-            tier=Tier.SAFETY,
+            tier=SAFETY,
             rationale=rationale,
-            prompts={
-                "ui_text": ui_text,
-                "assistant_hint": assistant_hint,
-                "followup_hint": followup_hint,
-            },
+            prompts=dict(self._prompts[SAFETY]),
             signals=signals,
             autonomous_action=False,
         )
@@ -213,41 +303,23 @@ class AdaptiveClarityProtocol:
         self,
         psi: float,
         dpsi_dt: float,
-        comps: Dict[str, float],
+        clamped: np.ndarray,
         flags: Dict[str, bool],
         context_tag: Optional[str],
     ) -> ACPDecision:
-        ui_text = (
-            "Let’s steady the pattern before we go deeper. Two quick options:\n"
-            "1) Clarify the goal in one line. 2) List the next two small steps.\n"
-            "We’ll resume full detail once the path feels aligned."
-        )
-        assistant_hint = (
-            "Stabilize purpose and structure. Reflect the user’s goal in ≤12 words, "
-            "surface one contradiction or missing piece, and offer a fork of two simple next steps. "
-            "Avoid long lectures; keep momentum intentional."
-        )
-        followup_hint = (
-            "Once P_align and I rise together (and dΨ/dt ≥ 0), propose returning to TRUTH tier."
-        )
-
         rationale = self._compose_rationale(
-            tier=Tier.COHERENCE,
+            tier=COHERENCE,
             psi=psi,
             dpsi_dt=dpsi_dt,
-            comps=comps,
+            clamped=clamped,
             flags=flags,
             extra="Low/stable Ψ or falling purpose alignment indicates we should rehabilitate pattern before facts."
         )
-        signals = self._signals_dict(psi, dpsi_dt, comps, flags, context_tag, Tier.COHERENCE)
+        signals = self._signals_dict(psi, dpsi_dt, clamped, flags, context_tag, COHERENCE)
         return ACPDecision(
-            tier=Tier.COHERENCE,
+            tier=COHERENCE,
             rationale=rationale,
-            prompts={
-                "ui_text": ui_text,
-                "assistant_hint": assistant_hint,
-                "followup_hint": followup_hint,
-            },
+            prompts=dict(self._prompts[COHERENCE]),
             signals=signals,
             autonomous_action=False,
         )
@@ -256,38 +328,23 @@ class AdaptiveClarityProtocol:
         self,
         psi: float,
         dpsi_dt: float,
-        comps: Dict[str, float],
+        clamped: np.ndarray,
         flags: Dict[str, bool],
         context_tag: Optional[str],
     ) -> ACPDecision:
-        ui_text = (
-            "Ready for straight answers. Ask directly, and I’ll be concise and precise."
-        )
-        assistant_hint = (
-            "Deliver facts. Cite sources when available. Keep paragraphs tight, "
-            "offer one alternative view if relevant, and provide a clean next-step."
-        )
-        followup_hint = (
-            "Invite a quick sanity-check: ‘Want me to zoom out if this drifts off your goal?’"
-        )
-
         rationale = self._compose_rationale(
-            tier=Tier.TRUTH,
+            tier=TRUTH,
             psi=psi,
             dpsi_dt=dpsi_dt,
-            comps=comps,
+            clamped=clamped,
             flags=flags,
             extra="Ψ above caution band with no hard-risk flags; proceed with normal reasoning."
         )
-        signals = self._signals_dict(psi, dpsi_dt, comps, flags, context_tag, Tier.TRUTH)
+        signals = self._signals_dict(psi, dpsi_dt, clamped, flags, context_tag, TRUTH)
         return ACPDecision(
-            tier=Tier.TRUTH,
+            tier=TRUTH,
             rationale=rationale,
-            prompts={
-                "ui_text": ui_text,
-                "assistant_hint": assistant_hint,
-                "followup_hint": followup_hint,
-            },
+            prompts=dict(self._prompts[TRUTH]),
             signals=signals,
             autonomous_action=False,
         )
@@ -295,25 +352,18 @@ class AdaptiveClarityProtocol:
     # ------------------------------
     # Helpers
     # ------------------------------
-    @staticmethod
-    def _clamp01(x: float) -> float:
-        return max(0.0, min(1.0, x))
-
     def _compose_rationale(
         self,
         tier: Tier,
         psi: float,
         dpsi_dt: float,
-        comps: Dict[str, float],
+        clamped: np.ndarray,
         flags: Dict[str, bool],
         extra: str,
     ) -> str:
-        e = self._clamp01(comps.get("E", 0.0))
-        i = self._clamp01(comps.get("I", 0.0))
-        o = self._clamp01(comps.get("O", 0.0))
-        p = self._clamp01(comps.get("P_align", 0.0))
+        e, i, o, p = clamped.tolist()
         parts = [
-            f"Tier={tier.value}",
+            _RATIONALE_PREFIX[tier],
             f"Ψ={psi:.3f}",
             f"dΨ/dt={dpsi_dt:+.3f}",
             f"E={e:.2f}, I={i:.2f}, O={o:.2f}, P_align={p:.2f}",
@@ -328,20 +378,21 @@ class AdaptiveClarityProtocol:
         self,
         psi: float,
         dpsi_dt: float,
-        comps: Dict[str, float],
+        clamped: np.ndarray,
         flags: Dict[str, bool],
         context_tag: Optional[str],
         tier: Tier,
     ) -> Dict[str, Any]:
+        e, i, o, p = clamped.tolist()
         return {
             "context": context_tag or "unspecified",
             "metrics": {
                 "psi": float(psi),
                 "dpsi_dt": float(dpsi_dt),
-                "E": self._clamp01(comps.get("E", 0.0)),
-                "I": self._clamp01(comps.get("I", 0.0)),
-                "O": self._clamp01(comps.get("O", 0.0)),
-                "P_align": self._clamp01(comps.get("P_align", 0.0)),
+                "E": e,
+                "I": i,
+                "O": o,
+                "P_align": p,
             },
             "thresholds": {
                 "crisis_threshold": self.cfg.crisis_threshold,
@@ -350,7 +401,7 @@ class AdaptiveClarityProtocol:
                 "min_c_phase_hold": self.cfg.min_c_phase_hold,
             },
             "flags": dict(flags),
-            "selected_tier": tier.value,
+            "selected_tier": tier,
         }
 
 
@@ -375,7 +426,7 @@ if __name__ == "__main__":
     for idx, (psi, dpsi_dt, comps, flags, tag) in enumerate(samples, 1):
         decision = acp.decide(psi, dpsi_dt, comps, flags, tag)
         print(f"\n=== SAMPLE {idx} ===")
-        print(f"Tier: {decision.tier.value}")
+        print(f"Tier: {decision.tier}")
         print(f"Rationale: {decision.rationale}")
         print("UI:", decision.prompts["ui_text"].splitlines()[0])
         print("Signals:", {k: decision.signals[k] for k in ("selected_tier", "metrics", "thresholds")})
@@ -12,22 +12,27 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src._c_phase_kernel import replay
 
 
 # --------------------------------------------------------------------
 # Data containers
 # --------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class PsiState:
     """Current coherence snapshot from Ψ-engine."""
     value: float
     gradient: float  # dΨ/dt
 
 
-@dataclass
+@dataclass(slots=True)
 class CrisisAlert:
     """Structured payload for human review / logging."""
     alert_id: str
@@ -44,6 +49,44 @@ class CrisisAlert:
         return asdict(self)
 
 
+# --------------------------------------------------------------------
+# Transition tables
+# --------------------------------------------------------------------
+# Each turn's inputs form a small key; the table gives the counter action,
+# so detect()/check_exit() do one lookup instead of a chain of branches.
+_COUNT = 1  # count this turn toward the sustained run (else reset it)
+_ENTER = 2  # not yet active: a sustained run opens C-Phase
+
+# detect(): key = (active << 2) | (below_crisis << 1) | hard_flag
+_DETECT_TRANSITIONS = bytes((
+    0,                 # idle,   Ψ ok,    no flag
+    _COUNT | _ENTER,   # idle,   Ψ ok,    hard flag
+    _COUNT | _ENTER,   # idle,   Ψ below, no flag
+    _COUNT | _ENTER,   # idle,   Ψ below, hard flag
+    0,                 # active, Ψ ok,    no flag
+    _COUNT,            # active, Ψ ok,    hard flag
+    _COUNT,            # active, Ψ below, no flag
+    _COUNT,            # active, Ψ below, hard flag
+))
+
+# check_exit(): key = (hard_flag << 1) | above_exit
+_EXIT_TRANSITIONS = bytes((
+    0,        # Ψ below exit, no flag
+    _COUNT,   # Ψ above exit, no flag
+    0,        # Ψ below exit, hard flag
+    0,        # Ψ above exit, hard flag
+))
+
+
+# 4-beat containment sequence used by deescalate().
+_BEATS: tuple[str, ...] = (
+    "GROUND → 'I’m here with you. Breathe—slow in, slow out.'",
+    "VALIDATE → 'This feels heavy. That’s understandable.'",
+    "TINY CONTROL → 'Choose one: sit · drink water · step outside.'",
+    "BRIDGE TO CARE → 'There’s a 24/7 counselor at 988. Want me to connect you?'",
+)
+
+
 # --------------------------------------------------------------------
 # Core runtime
 # --------------------------------------------------------------------
@@ -74,19 +117,27 @@ class CPhaseRuntime:
     # --------------------------------------------------------------
     def detect(self, psi: PsiState, hard_flag: bool = False) -> Optional[CrisisAlert]:
         """Return an alert when sustained crisis or explicit hard flag occurs."""
-        if hard_flag or psi.value < self.CRISIS_THRESHOLD:
-            self.crisis_turns += 1
-            if self.crisis_turns >= self.MIN_SUSTAINED and not self.active:
-                self.active = True
-                return self._make_alert(psi, reason="Ψ below threshold or hard flag")
-        else:
+        action = _DETECT_TRANSITIONS[
+            (self.active << 2)
+            | ((psi.value < self.CRISIS_THRESHOLD) << 1)
+            | bool(hard_flag)
+        ]
+        if not action & _COUNT:
             self.crisis_turns = 0
+            return None
+        self.crisis_turns += 1
+        if action & _ENTER and self.crisis_turns >= self.MIN_SUSTAINED:
+            self.active = True
+            return self._make_alert(psi, reason="Ψ below threshold or hard flag")
         return None
 
     def _make_alert(self, psi: PsiState, reason: str) -> CrisisAlert:
+        # One datetime for the ISO stamp; the ns clock gives a cheap,
+        # collision-resistant ID without a second datetime.
+        now = datetime.utcnow()
         return CrisisAlert(
-            alert_id=f"ALERT-{datetime.utcnow().timestamp()}",
-            timestamp=datetime.utcnow().isoformat(),
+            alert_id=f"ALERT-{time.time_ns()}",
+            timestamp=now.isoformat(),
             psi=psi.value,
             dpsi_dt=psi.gradient,
             reason=reason,
@@ -97,13 +148,7 @@ class CPhaseRuntime:
     # --------------------------------------------------------------
     def deescalate(self) -> str:
         """Return next message in 4-beat containment sequence."""
-        beats = [
-            "GROUND → 'I’m here with you. Breathe—slow in, slow out.'",
-            "VALIDATE → 'This feels heavy. That’s understandable.'",
-            "TINY CONTROL → 'Choose one: sit · drink water · step outside.'",
-            "BRIDGE TO CARE → 'There’s a 24/7 counselor at 988. Want me to connect you?'",
-        ]
-        text = beats[self._turn_counter % 4]
+        text = _BEATS[self._turn_counter & 3]
         self._turn_counter += 1
         return text
 
@@ -112,19 +157,19 @@ class CPhaseRuntime:
     # --------------------------------------------------------------
     def check_exit(self, psi: PsiState, hard_flag: bool = False) -> bool:
         """Return True when conditions safe to exit containment."""
-        if hard_flag:
+        action = _EXIT_TRANSITIONS[
+            (bool(hard_flag) << 1) | (psi.value >= self.EXIT_THRESHOLD)
+        ]
+        if not action & _COUNT:
             self.recovery_turns = 0
             return False
-        if psi.value >= self.EXIT_THRESHOLD:
-            self.recovery_turns += 1
-            if self.recovery_turns >= self.RESTORE_TURNS:
-                self.active = False
-                self.recovery_turns = 0
-                self.crisis_turns = 0
-                self._turn_counter = 0
-                return True
-        else:
+        self.recovery_turns += 1
+        if self.recovery_turns >= self.RESTORE_TURNS:
+            self.active = False
             self.recovery_turns = 0
+            self.crisis_turns = 0
+            self._turn_counter = 0
+            return True
         return False
 
     # --------------------------------------------------------------
@@ -154,13 +199,45 @@ class CPhaseRuntime:
             result["message"] = None
         return result
 
+    def step_batch(
+        self,
+        psi_values: np.ndarray,
+        hard_flags: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Replay a whole timeline through the same state machine as step().
+        Returns (tiers, alert_idx): int8 tier per turn (0=NORMAL, 1=SAFETY,
+        2=COHERENCE) and int32 indices of the turns that raised an alert.
+        Runtime state carries over to and from live step() calls.
+        """
+        psi = np.ascontiguousarray(psi_values, dtype=np.float64)
+        if hard_flags is None:
+            hard = np.zeros(psi.shape, dtype=np.bool_)
+        else:
+            hard = np.ascontiguousarray(hard_flags, dtype=np.bool_)
+        # replay() indexes hard by psi's length; a shorter array would read
+        # past its end.
+        if psi.ndim != 1 or hard.shape != psi.shape:
+            raise ValueError(
+                "step_batch expects psi_values and hard_flags of shape (N,) "
+                f"(got {psi.shape} and {hard.shape})."
+            )
+        (
+            tiers, alert_idx,
+            self.active, self.crisis_turns, self.recovery_turns, self._turn_counter,
+        ) = replay(
+            psi, hard,
+            self.CRISIS_THRESHOLD, self.EXIT_THRESHOLD,
+            self.MIN_SUSTAINED, self.RESTORE_TURNS,
+            self.active, self.crisis_turns, self.recovery_turns, self._turn_counter,
+        )
+        return tiers, alert_idx
+
 
 # --------------------------------------------------------------------
 # Demo block
 # --------------------------------------------------------------------
 if __name__ == "__main__":
-    import time
-
     runtime = CPhaseRuntime()
     timeline = [0.32, 0.18, 0.07, 0.06, 0.08, 0.12, 0.16]
 
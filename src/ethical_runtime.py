@@ -1,4 +1,4 @@
- """
+"""
 Atlas Ψ Framework: Ethical Runtime Environment
 Safety → Coherence → Truth hierarchy enforcement.
 
@@ -6,11 +6,53 @@ Author: Kenneth E. Whitman Jr.
 License: MIT
 """
 
+import copy
+import logging
+import re
 import yaml
+from functools import lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 from src.monitor import PsiMonitor
 
+logger = logging.getLogger(__name__)
+
+# Keyword categories for the placeholder scorers below.
+_KEYWORDS = {
+    "danger": ["kill myself", "end it", "die", "suicide"],
+    "intense": ["angry", "love", "terrified"],
+    "confused": ["confused"],
+    "purpose": ["purpose", "why", "meaning"],
+    "question": ["?"],
+}
+
+# All categories in one pattern, scanned once per message. The zero-width
+# lookahead tries every position without consuming text, so matching keeps
+# the plain-substring semantics of `word in message` (keywords may overlap
+# or sit inside longer words). One limit: at a single position only the
+# first category whose keyword matches there is reported, so a keyword
+# must never be a prefix of a keyword in another category (e.g. adding
+# "why not" to another category would hide "why" where both match).
+_KEYWORD_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<{name}>{'|'.join(map(re.escape, words))})"
+        for name, words in _KEYWORDS.items()
+    )
+    + "))"
+)
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _load_policy_cached(path_str: str, mtime: float) -> Dict:
+    """Parse a policy file once per (path, mtime); edits invalidate the entry."""
+    with open(path_str, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 class EthicalRuntime:
     """
     Ethical Runtime Environment
@@ -31,14 +73,18 @@ class EthicalRuntime:
     # ----------------------------------------------------------------------
     def _load_policy(self) -> Dict:
         if not self.policy_path.exists():
-            print(f"[WARN] Policy file missing at {self.policy_path}. Using defaults.")
+            logger.warning("Policy file missing at %s. Using defaults.", self.policy_path)
             return {
                 "safety": {"crisis_detection": {"threshold": 0.05}},
                 "coherence": {},
                 "truth": {}
             }
-        with open(self.policy_path, "r") as f:
-            return yaml.safe_load(f)
+        # Resolved path, so "policy/x.yaml" and its absolute form (or a
+        # symlink) share one entry and a cwd change can't serve a stale one.
+        path = self.policy_path.resolve()
+        mtime = path.stat().st_mtime
+        # Copy so one runtime can't mutate another's policy via the cache.
+        return copy.deepcopy(_load_policy_cached(str(path), mtime))
 
     # ----------------------------------------------------------------------
     # Evaluation Logic
@@ -48,11 +94,13 @@ class EthicalRuntime:
         Run message through the 3-layer evaluation process.
         Returns a dict with Ψ, layer states, and mode suggestion.
         """
+        hits = self._scan(message)
+
         # TODO: Real component extraction — placeholder for now
-        E, I, O, P_align = self._estimate_components(message)
+        E, I, O, P_align = self._estimate_components(hits)
         psi = self.monitor.update(message, E, I, O, P_align, context)
 
-        safety = self._check_safety(message)
+        safety = self._check_safety(hits)
         coherence = self._check_coherence(message, psi)
         truth = self._check_truth(message, psi)
 
@@ -67,21 +115,24 @@ class EthicalRuntime:
     # ----------------------------------------------------------------------
     # Layer Implementations
     # ----------------------------------------------------------------------
-    def _estimate_components(self, message: str):
+    @staticmethod
+    def _scan(message: str) -> frozenset:
+        """Keyword categories present in the message (one lowercase, one regex pass)."""
+        return frozenset(m.lastgroup for m in _KEYWORD_RE.finditer(message.lower()))
+
+    def _estimate_components(self, hits: frozenset):
         """
         Placeholder component estimation.
         Replace this with NLP scoring once the model plugin is added.
         """
-        message_lower = message.lower()
-        E = 0.8 if any(x in message_lower for x in ["angry", "love", "terrified"]) else 0.5
-        I = 0.7 if "?" not in message_lower else 0.5
-        O = 0.6 if "confused" not in message_lower else 0.3
-        P_align = 0.9 if any(x in message_lower for x in ["purpose", "why", "meaning"]) else 0.5
+        E = 0.8 if "intense" in hits else 0.5
+        I = 0.7 if "question" not in hits else 0.5
+        O = 0.6 if "confused" not in hits else 0.3
+        P_align = 0.9 if "purpose" in hits else 0.5
         return E, I, O, P_align
 
-    def _check_safety(self, message: str) -> Dict:
-        danger_words = ["kill myself", "end it", "die", "suicide"]
-        if any(word in message.lower() for word in danger_words):
+    def _check_safety(self, hits: frozenset) -> Dict:
+        if "danger" in hits:
             return {"status": "unsafe", "action": "alert_human_responder"}
         return {"status": "safe"}
 
@@ -111,7 +162,7 @@ class EthicalRuntime:
 
     def _alert_handler(self, alert: Dict):
         """Callback when Ψ < threshold"""
-        print(f"[ALERT] Ψ dropped below threshold! ψ={alert['psi']:.4f}")
+        logger.warning("[ALERT] Ψ dropped below threshold! ψ=%.4f", alert["psi"])
 
     # ----------------------------------------------------------------------
     # Export
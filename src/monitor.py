@@ -6,19 +6,44 @@ Author: Kenneth E. Whitman Jr.
 License: MIT
 """
 
-import time, json
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import time, json, logging, math, os
+from collections import deque
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Deque, Dict, List, Optional
 from datetime import datetime
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Audit exports must not depend on which optional packages are installed
+# (same rule as the engine exports), so the stdlib encoder is used on
+# every install and values are normalized first: dataclasses become dicts,
+# NumPy values become Python ones, and non-finite floats become null so
+# the files are strict JSON.
+
+def _plain(obj):
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, deque)):
+        return [_plain(v) for v in obj]
+    if is_dataclass(obj):
+        return {f.name: _plain(getattr(obj, f.name)) for f in fields(obj)}
+    tolist = getattr(obj, "tolist", None)  # NumPy scalars and arrays
+    return _plain(tolist()) if tolist is not None else obj
+
+def _json_line(obj) -> bytes:
+    """Encode one JSONL record."""
+    return (json.dumps(_plain(obj), ensure_ascii=False, allow_nan=False) + "\n").encode()
+
+@dataclass(slots=True)
 class Message:
     timestamp: float
     speaker: str          # "user" or "assistant"
     text: str
     meta: Dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class PsiSnapshot:
     timestamp: float
     E: float
@@ -29,7 +54,7 @@ class PsiSnapshot:
     dpsi_dt: Optional[float] = None
 
     def to_dict(self):
-        return vars(self)
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 class PsiMonitor:
     """
@@ -38,15 +63,23 @@ class PsiMonitor:
     Usage:
         mon = PsiMonitor(threshold=0.05)
         mon.update("message text", E=0.7, I=0.6, O=0.5, P_align=0.4)
+
+    history and snapshots are ring buffers holding the most recent
+    max_snapshots entries, so long sessions stay bounded in memory;
+    status() and the exports report how many older entries were dropped.
     """
 
-    def __init__(self, threshold: float = 0.05, alert=None):
+    def __init__(self, threshold: float = 0.05, alert=None, max_snapshots: int = 10_000):
         self.threshold = threshold
         self.alert_callback = alert
-        self.history: List[Message] = []
-        self.snapshots: List[PsiSnapshot] = []
+        self.max_snapshots = max_snapshots
+        self.history: Deque[Message] = deque(maxlen=max_snapshots)
+        self.snapshots: Deque[PsiSnapshot] = deque(maxlen=max_snapshots)
         self.alerts: List[Dict] = []
         self.start_time = time.time()
+        self._last_psi: Optional[float] = None
+        self._last_t: Optional[float] = None
+        self._n_updates = 0  # every update, including ones since dropped
 
     def update(self, text: str, E: float, I: float, O: float, P_align: float, meta=None):
         """Add new message + coherence snapshot."""
@@ -55,11 +88,12 @@ class PsiMonitor:
 
         psi = E * I * O * P_align
         dpsi = None
-        if self.snapshots:
-            prev = self.snapshots[-1]
-            dt = now - prev.timestamp
+        if self._last_t is not None:
+            dt = now - self._last_t
             if dt > 0:
-                dpsi = (psi - prev.psi) / dt
+                dpsi = (psi - self._last_psi) / dt
+        self._last_psi, self._last_t = psi, now
+        self._n_updates += 1
 
         snap = PsiSnapshot(now, E, I, O, P_align, psi, dpsi)
         self.snapshots.append(snap)
@@ -84,35 +118,78 @@ class PsiMonitor:
         self.alerts.append(record)
         if self.alert_callback:
             self.alert_callback(record)
-        print(f"[ALERT {level}] Ψ={snap.psi:.4f} | text='{text[:50]}'")
+        logger.warning("[ALERT %s] Ψ=%.4f | text=%r", level, snap.psi, text[:50])
 
     def status(self) -> Dict:
         """Return current monitoring state."""
-        if not self.snapshots:
+        psi = self._last_psi
+        if psi is None:
             return {"state": "idle", "psi": None}
-        s = self.snapshots[-1]
         return {
             "state": "active",
-            "messages": len(self.history),
-            "psi": s.psi,
-            "below_threshold": s.psi < self.threshold,
+            "messages": self._n_updates,
+            "psi": psi,
+            "below_threshold": psi < self.threshold,
             "alerts": len(self.alerts)
         }
 
     def export(self, path="psi_session.json"):
-        """Save full session for audit."""
+        """
+        Save session for audit: the most recent max_snapshots messages and
+        snapshots, with "dropped" counting older ones no longer held.
+        """
         data = {
             "started": datetime.fromtimestamp(self.start_time).isoformat(),
             "threshold": self.threshold,
-            "messages": [vars(m) for m in self.history],
-            "snapshots": [s.to_dict() for s in self.snapshots],
+            "dropped": self._dropped(),
+            "messages": list(self.history),
+            "snapshots": list(self.snapshots),
             "alerts": self.alerts,
             "status": self.status()
         }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_plain(data), f, indent=2, ensure_ascii=False, allow_nan=False)
+        self._warn_truncated(path)
+        print(f"Session exported to {path}")
+
+    def export_jsonl(self, path="psi_session.jsonl"):
+        """
+        Stream the session as JSON Lines, one record at a time.
+        path holds a header line (started, threshold, dropped) then one
+        snapshot per line; messages and alerts go to sibling
+        <stem>.messages.jsonl and <stem>.alerts.jsonl files.
+        """
+        stem, _ = os.path.splitext(path)
+        with open(path, "wb", buffering=1 << 16) as f:
+            f.write(_json_line({
+                "started": datetime.fromtimestamp(self.start_time).isoformat(),
+                "threshold": self.threshold,
+                "dropped": self._dropped(),
+            }))
+            for snap in self.snapshots:
+                f.write(_json_line(snap))
+        for suffix, records in ((".messages.jsonl", self.history), (".alerts.jsonl", self.alerts)):
+            with open(stem + suffix, "wb", buffering=1 << 16) as f:
+                for record in records:
+                    f.write(_json_line(record))
+        self._warn_truncated(path)
         print(f"Session exported to {path}")
 
+    def _dropped(self) -> Dict[str, int]:
+        """Entries pushed out of the ring buffers by max_snapshots."""
+        return {
+            "messages": self._n_updates - len(self.history),
+            "snapshots": self._n_updates - len(self.snapshots),
+        }
+
+    def _warn_truncated(self, path: str):
+        dropped = self._dropped()["snapshots"]
+        if dropped:
+            logger.warning(
+                "%s is truncated: oldest %d of %d entries dropped (max_snapshots=%d)",
+                path, dropped, self._n_updates, self.max_snapshots,
+            )
+
 # Example standalone usage
 if __name__ == "__main__":
     m = PsiMonitor()
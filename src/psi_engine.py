@@ -11,21 +11,28 @@ License: MIT
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import io
 import json
+import math
+import os
+import sys
+
+from src._psi_kernel import psi_series
 
 # ============================================================================
 # CORE DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """
     Represents a single narrative scene or conversational moment.
-    Components scored 0–1:
+    Components scored 0–1 (checked by PsiCurveEngine):
       E = Emotional intensity
       I = Information clarity
       O = Order or control
@@ -46,28 +53,43 @@ class Scene:
         """Compute Ψ = E × I × O × P_align"""
         return self.energy * self.information * self.order * self.p_align
 
-    def __post_init__(self):
-        for name, val in [('energy', self.energy), ('information', self.information),
-                          ('order', self.order), ('p_align', self.p_align)]:
-            if not 0.0 <= val <= 1.0:
-                raise ValueError(f"{name} must be between 0–1 (got {val}).")
-
 # ============================================================================
 # EMOTIONAL CLASSIFICATION
 # ============================================================================
 
-EMOTION_BANDS = [
-    ("Transcendence", 0.7, float('inf')),
-    ("Resolve", 0.4, 0.7),
-    ("Hope", 0.08, 0.4),
-    ("Stable", -0.1, 0.08),
-    ("Fear", -0.4, -0.1),
-    ("Despair", -0.7, -0.4),
-    ("Collapse", float('-inf'), -0.7),
-]
+# Bands by dΨ/dt, highest first, frozen as typed tables built once at
+# import: band k covers [_BAND_LO[k], _BAND_HI[k]).
+_BAND_LABELS = ("Transcendence", "Resolve", "Hope", "Stable", "Fear", "Despair", "Collapse")
+_BAND_LO = np.array([0.7, 0.4, 0.08, -0.1, -0.4, -0.7, -np.inf], dtype=np.float64)
+_BAND_HI = np.array([np.inf, 0.7, 0.4, 0.08, -0.1, -0.4, -0.7], dtype=np.float64)
+
+EMOTION_BANDS = list(zip(_BAND_LABELS, _BAND_LO.tolist(), _BAND_HI.tolist()))
+
+# The same table laid out for np.searchsorted: ascending lower edges (the
+# open-ended Collapse band has none) and the matching names, with a
+# trailing "Unknown" slot for NaN / +inf rates.
+_BAND_EDGES = _BAND_LO[-2::-1].copy()
+_BAND_NAMES = np.array(_BAND_LABELS[::-1] + ("Unknown",), dtype=object)
+
+for _table in (_BAND_LO, _BAND_HI, _BAND_EDGES, _BAND_NAMES):
+    _table.flags.writeable = False
+del _table
 
 DARK_MIN, DARK_MAX = 0.005, 0.05
 
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson r for NaN-free float arrays; NaN if either side is constant."""
+    a = a - a.mean()
+    b = b - b.mean()
+    denom = np.sqrt((a @ a) * (b @ b))
+    return float(a @ b / denom) if denom else float("nan")
+
+def _headless() -> bool:
+    """True when no display is available (CI, SSH sessions, containers)."""
+    return sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    )
+
 # ============================================================================
 # MAIN ENGINE
 # ============================================================================
@@ -75,70 +97,224 @@ DARK_MIN, DARK_MAX = 0.005, 0.05
 class PsiCurveEngine:
     """Calculates coherence dynamics (Ψ) and emotional derivatives (dΨ/dt)."""
 
+    # Figure shared by plot() across calls and engines.
+    _fig = _ax = _line = _points = None
+
     def __init__(self, scenes: List[Scene], title: str = "Analysis"):
         if len(scenes) < 2:
             raise ValueError("At least two scenes required for derivative.")
         self.scenes = scenes
         self.title = title
-        self.df = None
+        self._df = None
+        self._summary = None
         self._compute()
 
     def _compute(self):
-        t = [s.timestamp for s in self.scenes]
-        psi = [s.calculate_psi() for s in self.scenes]
-        dpsi = np.gradient(psi, t)
-        emo = [self._classify(d) for d in dpsi]
-        self.df = pd.DataFrame({
-            "scene": [s.scene_number for s in self.scenes],
-            "timestamp": t,
-            "title": [s.title for s in self.scenes],
-            "E": [s.energy for s in self.scenes],
-            "I": [s.information for s in self.scenes],
-            "O": [s.order for s in self.scenes],
-            "P_align": [s.p_align for s in self.scenes],
-            "Ψ": psi,
-            "dΨ/dt": dpsi,
-            "emotion": emo,
-            "notes": [s.notes for s in self.scenes]
-        })
-        self.df["dark_night"] = self.df["Ψ"].between(DARK_MIN, DARK_MAX)
-        self.df["collapse"] = self.df["Ψ"] < DARK_MIN
-
-    def _classify(self, rate):
-        for name, lo, hi in EMOTION_BANDS:
-            if lo <= rate < hi:
-                return name
-        return "Unknown"
+        n = len(self.scenes)
+        # Single pass over the scenes into an (n, 4) block of E, I, O, P_align,
+        # then one transpose so each component is its own contiguous array.
+        block = np.fromiter(
+            ((s.energy, s.information, s.order, s.p_align) for s in self.scenes),
+            dtype=np.dtype((np.float64, 4)),
+            count=n,
+        )
+        # Bounds for every scene in one vectorized check (NaN fails too);
+        # only the error path looks up which scene and component.
+        out_of_range = ~((block >= 0.0) & (block <= 1.0))
+        if out_of_range.any():
+            row, col = np.argwhere(out_of_range)[0]
+            name = ("energy", "information", "order", "p_align")[col]
+            raise ValueError(
+                f"Scene {self.scenes[row].scene_number}: {name} must be between 0–1 "
+                f"(got {block[row, col]})."
+            )
+        self._comps = np.ascontiguousarray(block.T)
+        self._E, self._I, self._O, self._P = self._comps
+        self._t = t = np.fromiter((s.timestamp for s in self.scenes), dtype=np.float64, count=n)
+        psi, dpsi, band = psi_series(self._comps, t, _BAND_EDGES)
+        self._psi, self._dpsi = psi, dpsi
+        self._emo = band.astype(np.int8)  # index into _BAND_NAMES
+        self._dark_night = (psi >= DARK_MIN) & (psi <= DARK_MAX)
+        self._collapse = psi < DARK_MIN
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Per-scene results as a DataFrame, built on first access."""
+        # The arrays from _compute are the source of truth; callers that
+        # only need summary() never pay for DataFrame construction.
+        if self._df is None:
+            self._df = pd.DataFrame({
+                "scene": [s.scene_number for s in self.scenes],
+                "timestamp": self._t,
+                "title": [s.title for s in self.scenes],
+                "E": self._E,
+                "I": self._I,
+                "O": self._O,
+                "P_align": self._P,
+                "Ψ": self._psi,
+                "dΨ/dt": self._dpsi,
+                "emotion": _BAND_NAMES[self._emo],
+                "notes": [s.notes for s in self.scenes],
+                "dark_night": self._dark_night,
+                "collapse": self._collapse,
+            })
+        return self._df
 
     def summary(self) -> Dict:
+        # Scenes are fixed once _compute has run, so the stats are computed
+        # on first call; each caller gets its own copy of the cached dict.
+        if self._summary is None:
+            psi = self._psi
+            self._summary = {
+                "mean_psi": psi.mean(),
+                "min_psi": psi.min(),
+                "max_psi": psi.max(),
+                "dark_nights": np.count_nonzero(self._dark_night),
+                "extreme_collapses": np.count_nonzero(self._collapse),
+                "p_align_corr": _pearson(self._P, self._psi),
+            }
+        return dict(self._summary)
+
+    def generate_report(self) -> str:
+        """Plain-text scene breakdown plus summary statistics."""
         d = self.df
-        return {
-            "mean_psi": d["Ψ"].mean(),
-            "min_psi": d["Ψ"].min(),
-            "max_psi": d["Ψ"].max(),
-            "dark_nights": d["dark_night"].sum(),
-            "extreme_collapses": d["collapse"].sum(),
-            "p_align_corr": d["P_align"].corr(d["Ψ"]),
-        }
+        stats = self.summary()
+        rule = "=" * 72
+        buf = io.StringIO()
+        buf.write(f"{rule}\nΨ-CURVE REPORT: {self.title}\n{rule}\n\n")
+        buf.write("SCENE BREAKDOWN\n" + "-" * 72 + "\n")
+        buf.write(f"{'#':>3}  {'Time':>6}  {'Title':<30}  {'Ψ':>7}  {'dΨ/dt':>8}  Emotion\n")
+        for num, t, title, psi, dpsi, emo, dark, collapse in zip(
+            d["scene"].tolist(), d["timestamp"].tolist(), d["title"].tolist(),
+            d["Ψ"].tolist(), d["dΨ/dt"].tolist(), d["emotion"].tolist(),
+            d["dark_night"].tolist(), d["collapse"].tolist(),
+        ):
+            flag = "  ← COLLAPSE" if collapse else "  ← DARK NIGHT" if dark else ""
+            buf.write(f"{num:>3}  {t:>6g}  {title[:30]:<30}  {psi:>7.4f}  {dpsi:>+8.4f}  {emo}{flag}\n")
+        buf.write("\nSUMMARY STATISTICS\n" + "-" * 18 + "\n")
+        buf.write(f"Total Scenes: {len(d)}\n")
+        buf.write(f"Mean Ψ: {stats['mean_psi']:.3f}\n")
+        buf.write(f"Min Ψ: {stats['min_psi']:.3f}\n")
+        buf.write(f"Max Ψ: {stats['max_psi']:.3f}\n")
+        buf.write(f"Dark Night Scenes: {stats['dark_nights']}\n")
+        buf.write(f"Extreme Collapses: {stats['extreme_collapses']}\n")
+        buf.write(f"P_align Correlation: {stats['p_align_corr']:.2f}\n")
+        return buf.getvalue()
+
+    def plot(self, save_path=None, show=True):
+        # matplotlib is imported on first use so analysis-only callers
+        # never pay for it.
+        import matplotlib
+        headless = bool(save_path) and _headless()
+        if headless:
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
 
-    def plot(self, save_path=None):
-        fig, ax = plt.subplots(figsize=(10,6))
-        ax.plot(self.df["timestamp"], self.df["Ψ"], color="blue", lw=2)
-        ax.scatter(self.df["timestamp"], self.df["Ψ"], color="navy", s=40)
-        ax.axhspan(DARK_MIN, DARK_MAX, color="red", alpha=0.15, label="Dark Night")
+        # Reuse the last figure while it is still open: only the data and
+        # title change between calls, so axes, ticks and the Dark Night band
+        # are not rebuilt.
+        cls = type(self)
+        t, psi = self._t, self._psi
+        if cls._fig is None or not plt.fignum_exists(cls._fig.number):
+            fig, ax = plt.subplots(figsize=(10,6))
+            line, = ax.plot(t, psi, color="blue", lw=2)
+            points = ax.scatter(t, psi, color="navy", s=40)
+            ax.axhspan(DARK_MIN, DARK_MAX, color="red", alpha=0.15, label="Dark Night")
+            ax.set_xlabel("Time")
+            ax.set_ylabel("Ψ (Coherence)")
+            ax.legend()
+            cls._fig, cls._ax, cls._line, cls._points = fig, ax, line, points
+        else:
+            fig, ax = cls._fig, cls._ax
+            cls._line.set_data(t, psi)
+            cls._points.set_offsets(np.column_stack((t, psi)))
+            ax.relim()
+            ax.autoscale_view()
+            fig.canvas.draw_idle()
         ax.set_title(f"{self.title} Ψ-Curve")
-        ax.set_xlabel("Time")
-        ax.set_ylabel("Ψ (Coherence)")
-        ax.legend()
         if save_path:
-            plt.savefig(save_path, dpi=300)
-        plt.show()
+            fig.savefig(save_path, dpi=300)
+        if show and not headless:
+            plt.show()
+
+    def export_csv(self, path="psi_results.csv"):
+        _write_csv(self._columns(), path)
+        print(f"Exported results to {path}")
 
     def export_json(self, path="psi_results.json"):
-        with open(path, "w") as f:
-            json.dump(self.df.to_dict(orient="records"), f, indent=2)
+        _write_json(self._columns(), path)
         print(f"Exported results to {path}")
 
+    def export_all(self, out_dir="outputs", prefix="psi") -> Dict[str, str]:
+        """
+        Write CSV, JSON and the Ψ-curve PNG to out_dir in one pass.
+        Columns are pulled from the DataFrame once and shared by the
+        writers; CSV and JSON run on worker threads while the plot is
+        rendered on the calling thread (pyplot is not thread-safe).
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        paths = {
+            "csv": os.path.join(out_dir, f"{prefix}_analysis.csv"),
+            "json": os.path.join(out_dir, f"{prefix}_analysis.json"),
+            "png": os.path.join(out_dir, f"{prefix}_psi_curve.png"),
+        }
+        cols = self._columns()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            jobs = [
+                pool.submit(_write_csv, cols, paths["csv"]),
+                pool.submit(_write_json, cols, paths["json"]),
+            ]
+            self.plot(save_path=paths["png"], show=False)
+            for job in jobs:
+                job.result()
+        for path in paths.values():
+            print(f"Exported results to {path}")
+        return paths
+
+    def _columns(self) -> Dict[str, list]:
+        return {c: self.df[c].tolist() for c in self.df.columns}
+
+# ============================================================================
+# EXPORT WRITERS
+# ============================================================================
+
+# Exports must not depend on which optional packages are installed, so
+# values are normalized here and both CSV paths are pinned to one format:
+# every cell rendered by _csv_cell, every field quoted, "\n" line endings.
+
+def _csv_cell(v) -> str:
+    if isinstance(v, bool):
+        return "True" if v else "False"
+    if isinstance(v, float):
+        return repr(v) if not math.isnan(v) else ""
+    return "" if v is None else str(v)
+
+def _write_csv(cols: Dict[str, list], path: str):
+    cells = {name: [_csv_cell(v) for v in values] for name, values in cols.items()}
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # optional: pyarrow's C++ CSV writer
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            w.writerow(cells.keys())
+            w.writerows(zip(*cells.values()))
+    else:
+        # All-string columns: pyarrow's default "needed" quoting quotes each one.
+        pacsv.write_csv(pa.table(cells), path)
+
+def _write_json(cols: Dict[str, list], path: str):
+    # Non-finite rates (duplicate timestamps) become null so the file is
+    # strict JSON. The stdlib encoder is used on every install: orjson
+    # formats floats differently (1e-5 vs 1e-05).
+    cols = {
+        name: [None if isinstance(v, float) and not math.isfinite(v) else v for v in values]
+        for name, values in cols.items()
+    }
+    records = [dict(zip(cols, row)) for row in zip(*cols.values())]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2, ensure_ascii=False, allow_nan=False)
+
 # ============================================================================
 # EXAMPLE
 # ============================================================================
@@ -15,11 +15,54 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
+import os
 import uuid
 import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:  # optional: required only when an encryption_key is set
+    AESGCM = None
+
+
+def _json_default(obj):
+    """Encode NumPy scalars (np.float32, np.int64, np.bool_) as their Python value."""
+    item = getattr(obj, "item", None)
+    if item is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return item()
+
+
+def _dumps(payload: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=_json_default).encode()
+
+
+def _decode_key(encryption_key: Union[str, bytes]) -> bytes:
+    """Return the raw AES-256 key, rejecting anything but 32 bytes."""
+    key = encryption_key
+    if isinstance(key, str):
+        try:
+            key = base64.b64decode(key, validate=True)
+        except binascii.Error:
+            raise ValueError(
+                "encryption_key must be 32 raw bytes or their base64 encoding "
+                "(a passphrase is not a key)"
+            ) from None
+    if len(key) != 32:
+        raise ValueError(f"encryption_key must be 32 bytes for AES-256 (got {len(key)}).")
+    return key
 
 
 class SafetyGatewayClient:
@@ -39,27 +82,72 @@ class SafetyGatewayClient:
     def __init__(
         self,
         gateway_url: Optional[str] = None,
-        encryption_key: Optional[str] = None,
+        encryption_key: Optional[Union[str, bytes]] = None,
         local_log: str = "safety_alerts.log",
     ):
         self.gateway_url = gateway_url
         self.encryption_key = encryption_key
         self.local_log = local_log
+        self._log_fp = None  # opened on first alert, see _write_local
+
+        # AES-256-GCM cipher built once; the key is 32 raw bytes or their
+        # base64 text.
+        self._aead = None
+        if encryption_key is not None:
+            key = _decode_key(encryption_key)
+            if AESGCM is None:
+                raise ImportError(
+                    "encryption_key requires the 'cryptography' package "
+                    "(pip install atlas-psi-framework[crypto])"
+                )
+            self._aead = AESGCM(key)
 
     # ----------------------------------------------------------
-    # Utility: Fake encryption (placeholder for real AES)
+    # Utility: Encryption
     # ----------------------------------------------------------
     def _encrypt(self, payload: Dict) -> str:
-        """Basic reversible encoder. Replace with AES-256 in production."""
-        raw = json.dumps(payload)
-        return raw[::-1]  # naive reverse-string "encryption"
+        """
+        AES-GCM encrypt payload when an encryption_key is configured.
+        Returns base64(nonce + ciphertext + tag).
+
+        Without a key this falls back to the reversible placeholder
+        encoder, which is NOT encryption.
+        """
+        if self._aead is None:
+            raw = json.dumps(payload, default=_json_default)
+            return raw[::-1]  # naive reverse-string placeholder
+        raw = _dumps(payload)
+        nonce = os.urandom(12)
+        sealed = self._aead.encrypt(nonce, raw, None)
+        return base64.b64encode(nonce + sealed).decode("ascii")
 
     # ----------------------------------------------------------
     # Logging
     # ----------------------------------------------------------
     def _write_local(self, encrypted: str):
-        with open(self.local_log, "a") as f:
-            f.write(f"{encrypted}\n")
+        # One long-lived handle instead of open/close per alert. Each alert
+        # is flushed straight away: this is the human-review audit trail, so
+        # nothing may wait in the buffer for a crash to lose.
+        if self._log_fp is None:
+            self._log_fp = open(self.local_log, "ab", buffering=1 << 16)
+        self._log_fp.write(encrypted.encode() + b"\n")
+        self._log_fp.flush()
+
+    def close(self):
+        """Flush and close the local alert log."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_log_fp", None) is not None:
+            self.close()
 
     # ----------------------------------------------------------
     # Human alert
@@ -146,3 +234,5 @@ if __name__ == "__main__":
 
     print("\n--- User Gives Consent (Example) ---")
     print(client.verify_consent(r["gateway_id"], reviewer="Dr. Lee"))
+
+    client.close()
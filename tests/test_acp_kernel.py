@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from src import _acp_kernel as K
+from src.acp_runtime import ACPConfig, AdaptiveClarityProtocol
+
+CODES = {"SAFETY": K.TIER_SAFETY, "COHERENCE": K.TIER_COHERENCE, "TRUTH": K.TIER_TRUTH}
+
+CONFIGS = [
+    ACPConfig(),
+    ACPConfig(crisis_threshold=0.10, caution_band=0.30, rapid_decline=-0.20),
+]
+
+
+def reference_tier(psi, dpsi, I, P, flag, cfg):
+    """Baseline ACP decision tree (_needs_safety / _needs_coherence)."""
+    if flag or psi < cfg.crisis_threshold:
+        return K.TIER_SAFETY
+    if dpsi <= cfg.rapid_decline and (P < 0.10 or I < 0.10):
+        return K.TIER_SAFETY
+    if cfg.crisis_threshold <= psi < cfg.caution_band:
+        return K.TIER_COHERENCE
+    if psi >= cfg.caution_band and P < 0.20 and dpsi < 0.0:
+        return K.TIER_COHERENCE
+    return K.TIER_TRUTH
+
+
+def random_turns(cfg, n=4000, seed=0):
+    """Random turns with every threshold and NaN mixed in."""
+    rng = np.random.default_rng(seed)
+
+    def pick(values, low, high):
+        return np.where(rng.random(n) < 0.3, rng.choice(values, n), rng.uniform(low, high, n))
+
+    psi = pick([cfg.crisis_threshold, cfg.caution_band, 0.0, np.nan], 0.0, 0.5)
+    dpsi = pick([cfg.rapid_decline, 0.0, -0.0, np.nan], -1.0, 1.0)
+    comps = rng.random((n, 4))
+    comps[:, 1] = pick([0.10, 0.0], 0.0, 0.3)
+    comps[:, 3] = pick([0.10, 0.20, 0.0], 0.0, 0.4)
+    flags = (rng.random(n) < 0.1).astype(np.int64)
+    return psi, dpsi, comps, flags
+
+
+@pytest.mark.parametrize("cfg", CONFIGS)
+def test_all_selection_paths_match_baseline(cfg):
+    psi, dpsi, comps, flags = random_turns(cfg)
+    want = np.array([
+        reference_tier(p, d, c[1], c[3], f, cfg)
+        for p, d, c, f in zip(psi, dpsi, comps, flags)
+    ])
+    thresholds = (cfg.crisis_threshold, cfg.caution_band, cfg.rapid_decline)
+
+    acp = AdaptiveClarityProtocol(cfg)
+    scalar = np.array([
+        CODES[acp.decide(
+            p, d, dict(zip(("E", "I", "O", "P_align"), c)),
+            {"explicit_self_harm": bool(f)},
+        ).tier]
+        for p, d, c, f in zip(psi, dpsi, comps, flags)
+    ])
+    np.testing.assert_array_equal(scalar, want)
+
+    batch = acp.decide_batch(psi, dpsi, comps, flags)
+    assert batch.dtype == np.int8
+    np.testing.assert_array_equal(batch, want)
+
+    numpy_batch = K._decide_batch_numpy(psi, dpsi, comps, flags, *thresholds)
+    np.testing.assert_array_equal(numpy_batch, want)
+
+    # Pure-Python run of the per-turn kernel (the Numba source when compiled).
+    decide_tier = getattr(K._decide_tier, "py_func", K._decide_tier)
+    per_turn = np.array([
+        decide_tier(p, d, c[1], c[3], f, *thresholds)
+        for p, d, c, f in zip(psi, dpsi, comps, flags)
+    ])
+    np.testing.assert_array_equal(per_turn, want)
+
+
+@pytest.mark.parametrize("field, bad", [
+    ("psi", np.zeros((5, 1))),
+    ("dpsi", np.zeros(4)),
+    ("comps", np.zeros((5, 3))),
+    ("comps", np.zeros(5)),
+    ("flags", np.zeros(6, dtype=np.int64)),
+])
+def test_decide_batch_rejects_mismatched_shapes(field, bad):
+    args = {"psi": np.zeros(5), "dpsi": np.zeros(5), "comps": np.zeros((5, 4)),
+            "flags": np.zeros(5, dtype=np.int64)}
+    args[field] = bad
+    with pytest.raises(ValueError, match="shape"):
+        AdaptiveClarityProtocol().decide_batch(args["psi"], args["dpsi"], args["comps"], args["flags"])
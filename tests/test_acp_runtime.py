@@ -0,0 +1,56 @@
+import copy
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from src.acp_runtime import ACPConfig, AdaptiveClarityProtocol
+
+
+@pytest.fixture
+def decision():
+    acp = AdaptiveClarityProtocol()
+    return acp.decide(0.07, -0.6, {"E": 0.8, "I": 0.08, "O": 0.45, "P_align": 0.09})
+
+
+def test_decision_pickles(decision):
+    restored = pickle.loads(pickle.dumps(decision))
+    assert restored.to_dict() == decision.to_dict()
+
+
+def test_decision_deepcopies(decision):
+    assert copy.deepcopy(decision).to_dict() == decision.to_dict()
+
+
+def test_decision_asdict_matches_to_dict(decision):
+    assert dataclasses.asdict(decision) == decision.to_dict()
+
+
+def test_prompts_json_serializable(decision):
+    assert json.loads(json.dumps(decision.prompts)) == decision.prompts
+
+
+def test_mutating_prompts_does_not_leak(decision):
+    acp = AdaptiveClarityProtocol()
+    first = acp.decide(0.07, -0.6, {"E": 0.8, "I": 0.08, "O": 0.45, "P_align": 0.09})
+    first.prompts["ui_text"] = "edited"
+    first.to_dict()["prompts"]["assistant_hint"] = "edited"
+    second = acp.decide(0.07, -0.6, {"E": 0.8, "I": 0.08, "O": 0.45, "P_align": 0.09})
+    assert second.prompts == decision.prompts
+
+
+def test_config_cannot_drift_from_compiled_rule():
+    acp = AdaptiveClarityProtocol()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        acp.cfg.crisis_threshold = 0.5
+    with pytest.raises(AttributeError):
+        acp.cfg = ACPConfig(crisis_threshold=0.5)
+    decision = acp.decide(0.10, 0.0, {"E": 0.5, "I": 0.5, "O": 0.5, "P_align": 0.5})
+    assert decision.tier == "COHERENCE"
+    assert decision.signals["thresholds"]["crisis_threshold"] == 0.05
+
+
+def test_config_pickles():
+    cfg = ACPConfig(crisis_threshold=0.10)
+    assert pickle.loads(pickle.dumps(cfg)) == cfg
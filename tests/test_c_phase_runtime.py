@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from src import _c_phase_kernel as K
+from src.c_phase_runtime import CPhaseRuntime, PsiState
+
+CODES = {"NORMAL": K.TIER_NORMAL, "SAFETY": K.TIER_SAFETY, "COHERENCE": K.TIER_COHERENCE}
+
+
+def random_timeline(seed, n=80):
+    rng = np.random.default_rng(seed)
+    psi = rng.choice([0.0, 0.01, 0.05, 0.07, 0.10, 0.2, 0.5, np.nan], n)
+    hard = rng.random(n) < 0.1
+    return psi, hard
+
+
+def run_step(runtime, psi, hard):
+    tiers, alerts = [], []
+    for k, (value, flag) in enumerate(zip(psi.tolist(), hard.tolist())):
+        out = runtime.step(PsiState(value, 0.0), flag)
+        tiers.append(CODES[out["tier"]])
+        if "alert" in out:
+            alerts.append(k)
+    return tiers, alerts
+
+
+def state(runtime):
+    return runtime.active, runtime.crisis_turns, runtime.recovery_turns, runtime._turn_counter
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_step_batch_matches_step(seed):
+    psi, hard = random_timeline(seed)
+    live = CPhaseRuntime()
+    want_tiers, want_alerts = run_step(live, psi, hard)
+
+    batch = CPhaseRuntime()
+    tiers, alert_idx = batch.step_batch(psi, hard)
+    assert tiers.dtype == np.int8 and alert_idx.dtype == np.int32
+    assert tiers.tolist() == want_tiers
+    assert alert_idx.tolist() == want_alerts
+    assert state(batch) == state(live)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_step_batch_resumes_live_state(seed):
+    psi, hard = random_timeline(seed)
+    live = CPhaseRuntime()
+    want_tiers, _ = run_step(live, psi, hard)
+
+    mixed = CPhaseRuntime()
+    head, _ = run_step(mixed, psi[:30], hard[:30])
+    tail, _ = mixed.step_batch(psi[30:], hard[30:])
+    assert head + tail.tolist() == want_tiers
+    assert state(mixed) == state(live)
+
+
+def test_replay_python_source_matches_compiled():
+    replay = getattr(K.replay, "py_func", K.replay)
+    psi, hard = random_timeline(0)
+    args = (psi, hard, 0.05, 0.10, 2, 3, False, 0, 0, 0)
+    compiled, python = K.replay(*args), replay(*args)
+    np.testing.assert_array_equal(compiled[0], python[0])
+    np.testing.assert_array_equal(compiled[1], python[1])
+    assert compiled[2:] == python[2:]
+
+
+@pytest.mark.parametrize("psi, hard", [
+    (np.zeros(5), np.zeros(4, dtype=bool)),
+    (np.zeros(5), np.zeros(6, dtype=bool)),
+    (np.zeros((5, 1)), None),
+])
+def test_step_batch_rejects_mismatched_shapes(psi, hard):
+    runtime = CPhaseRuntime()
+    with pytest.raises(ValueError, match="shape"):
+        runtime.step_batch(psi, hard)
+    assert state(runtime) == state(CPhaseRuntime())
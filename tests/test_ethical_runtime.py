@@ -0,0 +1,80 @@
+import itertools
+import os
+import random
+
+import pytest
+
+from src.ethical_runtime import _KEYWORDS, EthicalRuntime, _load_policy_cached
+
+
+def reference_hits(message):
+    """Baseline scorer: one `word in message.lower()` test per keyword."""
+    lowered = message.lower()
+    return frozenset(
+        name for name, words in _KEYWORDS.items()
+        if any(word in lowered for word in words)
+    )
+
+
+FRAGMENTS = [word for words in _KEYWORDS.values() for word in words] + [
+    "died", "DIE", "Suicide", "WHY", "Kill Myself", "end it?", "meaningless",
+    "lovely", "unconfused", "?", "??", " ", "I ", "feel ", "ok", ".",
+]
+
+
+@pytest.mark.parametrize("message", [
+    "",
+    "He died last year.",
+    "I WANT TO DIE",
+    "Why?",
+    "suicidewhy",
+    "kill myself? why. meaning?",
+    "I'm angry, terrified and confused about my purpose",
+    "end it",
+    "friend it",
+])
+def test_scan_matches_substring_logic(message):
+    assert EthicalRuntime._scan(message) == reference_hits(message)
+
+
+def test_scan_matches_substring_logic_random():
+    rng = random.Random(0)
+    for _ in range(2000):
+        message = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 6)))
+        if rng.random() < 0.5:
+            message = message.upper()
+        assert EthicalRuntime._scan(message) == reference_hits(message), message
+
+
+def test_no_keyword_prefixes_another_category():
+    for (a, words_a), (b, words_b) in itertools.permutations(_KEYWORDS.items(), 2):
+        for x, y in itertools.product(words_a, words_b):
+            assert not y.startswith(x), (a, x, b, y)
+
+
+def write_policy(path, threshold, mtime):
+    path.write_text(f"safety:\n  crisis_detection:\n    threshold: {threshold}\n")
+    os.utime(path, (mtime, mtime))
+
+
+def test_policy_edit_forces_reparse(tmp_path, monkeypatch):
+    policy = tmp_path / "policy.yaml"
+    write_policy(policy, 0.05, 1_000_000)
+    monkeypatch.chdir(tmp_path)
+    assert EthicalRuntime("policy.yaml").policy["safety"]["crisis_detection"]["threshold"] == 0.05
+    assert _load_policy_cached.cache_info().currsize >= 1
+
+    write_policy(policy, 0.25, 1_000_100)
+    for path in ("policy.yaml", str(policy)):
+        assert EthicalRuntime(path).policy["safety"]["crisis_detection"]["threshold"] == 0.25
+
+
+def test_policy_cache_shared_across_path_spellings(tmp_path, monkeypatch):
+    policy = tmp_path / "shared.yaml"
+    write_policy(policy, 0.07, 2_000_000)
+    monkeypatch.chdir(tmp_path)
+    EthicalRuntime(str(policy))
+    misses = _load_policy_cached.cache_info().misses
+    EthicalRuntime("shared.yaml")
+    EthicalRuntime("./shared.yaml")
+    assert _load_policy_cached.cache_info().misses == misses
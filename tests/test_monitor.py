@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+
+from src.monitor import PsiMonitor
+
+
+def fill(monitor, n):
+    for k in range(n):
+        monitor.update(f"turn {k}", 0.9, 0.9, 0.9, 0.9)
+
+
+def reject(constant):
+    raise ValueError(f"non-standard JSON constant {constant}")
+
+
+def test_status_counts_messages_past_the_cap():
+    monitor = PsiMonitor(max_snapshots=3)
+    fill(monitor, 10)
+    assert len(monitor.history) == 3
+    assert monitor.status()["messages"] == 10
+
+
+def test_exports_record_dropped_entries(tmp_path, caplog):
+    monitor = PsiMonitor(max_snapshots=3)
+    fill(monitor, 10)
+
+    monitor.export(tmp_path / "s.json")
+    data = json.loads((tmp_path / "s.json").read_text())
+    assert data["dropped"] == {"messages": 7, "snapshots": 7}
+    assert [m["text"] for m in data["messages"]] == ["turn 7", "turn 8", "turn 9"]
+
+    monitor.export_jsonl(str(tmp_path / "s.jsonl"))
+    header = json.loads((tmp_path / "s.jsonl").read_text().splitlines()[0])
+    assert header["dropped"] == {"messages": 7, "snapshots": 7}
+    assert "truncated" in caplog.text
+
+
+def test_no_drops_under_the_cap(tmp_path):
+    monitor = PsiMonitor()
+    fill(monitor, 5)
+    monitor.export(tmp_path / "s.json")
+    assert json.loads((tmp_path / "s.json").read_text())["dropped"] == {"messages": 0, "snapshots": 0}
+
+
+def test_exports_are_strict_json_with_numpy_values(tmp_path):
+    monitor = PsiMonitor()
+    monitor.update("nan turn", np.float32(0.5), float("nan"), 0.5, 0.5, meta={"turn": np.int64(1)})
+    monitor.update("numpy turn", np.float64(0.9), 0.9, 0.9, 0.9, meta={"flags": np.array([True, False])})
+
+    monitor.export(tmp_path / "s.json")
+    data = json.loads((tmp_path / "s.json").read_text(encoding="utf-8"), parse_constant=reject)
+    assert data["snapshots"][0]["psi"] is None and data["snapshots"][0]["E"] == 0.5
+    assert data["messages"][0]["meta"] == {"turn": 1}
+    assert data["messages"][1]["meta"] == {"flags": [True, False]}
+
+    monitor.export_jsonl(str(tmp_path / "s.jsonl"))
+    lines = (tmp_path / "s.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line, parse_constant=reject) for line in lines]
+    assert records[1]["psi"] is None and records[1]["I"] is None
+    messages = (tmp_path / "s.messages.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(messages[1])["meta"] == {"flags": [True, False]}
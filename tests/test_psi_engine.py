@@ -0,0 +1,38 @@
+import json
+import sys
+
+import pytest
+
+from src.psi_engine import PsiCurveEngine, Scene
+
+
+@pytest.fixture
+def engine():
+    scenes = [
+        Scene(1, 0, "Opening", 0.4, 0.8, 0.9, 0.7),
+        Scene(2, 10, 'Crisis, "part one"', 0.9, 0.4, 0.3, 0.2, notes="a,b"),
+        Scene(3, 10, "Same timestamp", 0.1, 0.1, 0.1, 0.1),  # non-finite dΨ/dt
+        Scene(4, 20, "Recovery", 0.7, 0.9, 0.8, 0.9),
+    ]
+    return PsiCurveEngine(scenes, title="Fixture")
+
+
+def test_csv_identical_with_and_without_pyarrow(engine, tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    engine.export_csv(tmp_path / "arrow.csv")
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    engine.export_csv(tmp_path / "stdlib.csv")
+    assert (tmp_path / "arrow.csv").read_bytes() == (tmp_path / "stdlib.csv").read_bytes()
+
+
+def test_json_is_strict_and_nulls_non_finite_rates(engine, tmp_path):
+    path = tmp_path / "out.json"
+    engine.export_json(path)
+
+    def reject(constant):
+        raise ValueError(constant)
+
+    records = json.loads(path.read_text(encoding="utf-8"), parse_constant=reject)
+    assert len(records) == 4
+    assert any(r["dΨ/dt"] is None for r in records)
+    assert records[0]["dark_night"] is False
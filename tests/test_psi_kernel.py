@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from src._psi_kernel import psi_curve, psi_series
+from src.psi_engine import _BAND_EDGES
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_psi_series_matches_numpy(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 40))
+    comps = rng.random((4, n))
+    t = np.sort(rng.choice(200, n, replace=False)).astype(np.float64)
+
+    psi, dpsi, band = psi_series(comps, t, _BAND_EDGES)
+
+    want = comps[0] * comps[1] * comps[2] * comps[3]
+    np.testing.assert_array_equal(psi, want)
+    np.testing.assert_array_equal(psi_curve(comps), want)
+    np.testing.assert_allclose(dpsi, np.gradient(want, t), rtol=1e-9, atol=1e-12)
+    np.testing.assert_array_equal(band, np.searchsorted(_BAND_EDGES, dpsi, side="right"))
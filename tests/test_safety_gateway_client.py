@@ -0,0 +1,56 @@
+import base64
+import json
+import os
+
+import pytest
+
+from src.safety_gateway_client import SafetyGatewayClient
+
+
+@pytest.mark.parametrize("size", [16, 24, 31, 33])
+def test_rejects_non_aes256_key(size, tmp_path):
+    with pytest.raises(ValueError, match="32 bytes"):
+        SafetyGatewayClient(encryption_key=os.urandom(size), local_log=str(tmp_path / "a.log"))
+    with pytest.raises(ValueError, match="32 bytes"):
+        SafetyGatewayClient(
+            encryption_key=base64.b64encode(os.urandom(size)).decode(),
+            local_log=str(tmp_path / "a.log"),
+        )
+
+
+def test_rejects_passphrase(tmp_path):
+    with pytest.raises(ValueError, match="base64"):
+        SafetyGatewayClient(encryption_key="correct horse battery", local_log=str(tmp_path / "a.log"))
+
+
+def test_encrypted_alert_round_trips(tmp_path):
+    aead = pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead")
+    key = os.urandom(32)
+    log = tmp_path / "alerts.log"
+    with SafetyGatewayClient(encryption_key=base64.b64encode(key).decode(), local_log=str(log)) as client:
+        client.send_alert({"psi": 0.01})
+    blob = base64.b64decode(log.read_text().strip())
+    package = json.loads(aead.AESGCM(key).decrypt(blob[:12], blob[12:], None))
+    assert package["payload"] == {"psi": 0.01}
+
+
+def test_encrypted_alert_with_numpy_scalars(tmp_path):
+    aead = pytest.importorskip("cryptography.hazmat.primitives.ciphers.aead")
+    np = pytest.importorskip("numpy")
+    key = os.urandom(32)
+    log = tmp_path / "alerts.log"
+    payload = {"psi": np.float64(0.01), "dpsi": np.float32(-0.5), "turn": np.int64(3), "hard": np.bool_(True)}
+    with SafetyGatewayClient(encryption_key=base64.b64encode(key).decode(), local_log=str(log)) as client:
+        client.send_alert(payload)
+    blob = base64.b64decode(log.read_text().strip())
+    package = json.loads(aead.AESGCM(key).decrypt(blob[:12], blob[12:], None))
+    assert package["payload"] == {"psi": 0.01, "dpsi": -0.5, "turn": 3, "hard": True}
+
+
+def test_placeholder_alert_with_numpy_scalars(tmp_path):
+    np = pytest.importorskip("numpy")
+    log = tmp_path / "alerts.log"
+    with SafetyGatewayClient(local_log=str(log)) as client:
+        client.send_alert({"psi": np.float32(0.25), "turn": np.int64(3)})
+    package = json.loads(log.read_text().strip()[::-1])
+    assert package["payload"] == {"psi": 0.25, "turn": 3}